@@ -4,10 +4,9 @@ import argparse
 import sys
 from pathlib import Path
 
-from loguru import logger
-
-from shopping_list_sync.config import get_config_summary
-from shopping_list_sync.sync import ShoppingListSync
+# Banner separators for startup output
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
 
 
 def main():
@@ -54,17 +53,20 @@ def main():
 
     args = parser.parse_args()
 
+    # Heavy imports are deferred until after argparse so --help/--version stay fast
+    from loguru import logger
+
+    from shopping_list_sync.config import get_config_summary, settings
+    from shopping_list_sync.sync import ShoppingListSync
+
     # Update config if CLI arguments provided
     if args.log_level:
-        from shopping_list_sync.config import settings
         settings.LOG_LEVEL = args.log_level
 
     if args.log_file:
-        from shopping_list_sync.config import settings
         settings.LOG_FILE = args.log_file
 
     if args.config:
-        from shopping_list_sync.config import settings
         settings.CATEGORIES_FILE = str(args.config)
 
     # Re-setup logging with potentially updated settings
@@ -72,9 +74,9 @@ def main():
     setup_logging()
 
     # Display startup information
-    logger.info("=" * 60)
+    logger.info(_SEP_EQ)
     logger.info("Shopping List Sync v1.0.0")
-    logger.info("=" * 60)
+    logger.info(_SEP_EQ)
     logger.info(get_config_summary())
 
     # Initialize sync manager
@@ -100,6 +102,7 @@ def main():
         logger.info("Running one-time sync...")
         try:
             sync.check_and_sync()
+            sync.flush_state()
             logger.info("One-time sync completed successfully")
             sys.exit(0)
         except Exception as e:
@@ -110,7 +113,7 @@ def main():
     # Daemon mode (default)
     logger.info(f"Starting daemon mode with {sync.sync_interval}s interval...")
     logger.info("Press Ctrl+C to stop")
-    logger.info("-" * 60)
+    logger.info(_SEP_DASH)
 
     try:
         sync.start()
@@ -1,12 +1,19 @@
 """Configuration management for Shopping List Sync."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml-backed loader when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -44,8 +51,31 @@ class Settings:
 settings = Settings()
 
 
+@lru_cache(maxsize=4)
+def _load_categories_cached(path: str, mtime_ns: int) -> Dict:
+    """Parse a categories file; cached per (path, modification time)."""
+    with open(path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+
+    if 'categories' not in config:
+        raise ValueError("Categories file must contain a 'categories' key")
+
+    categories = config['categories']
+
+    # Precompute derived names once per load (e.g., "meat_seafood" -> "Meat Seafood")
+    for category_key, category_config in categories.items():
+        display_name = category_key.replace('_', ' ').title()
+        category_config['_display_name'] = display_name
+        category_config['_section_name'] = f"{category_config['emoji']} {display_name}"
+
+    return categories
+
+
 def load_categories() -> Dict:
-    """Load category mappings from YAML configuration file."""
+    """Load category mappings from YAML configuration file.
+
+    The parsed result is cached and only re-read when the file's modification time changes.
+    """
     categories_path = Path(settings.CATEGORIES_FILE)
 
     if not categories_path.exists():
@@ -54,13 +84,7 @@ def load_categories() -> Dict:
             f"Please ensure {settings.CATEGORIES_FILE} exists."
         )
 
-    with open(categories_path, 'r') as f:
-        config = yaml.safe_load(f)
-
-    if 'categories' not in config:
-        raise ValueError("Categories file must contain a 'categories' key")
-
-    return config['categories']
+    return _load_categories_cached(str(categories_path), categories_path.stat().st_mtime_ns)
 
 
 def get_config_summary() -> str:
@@ -14,10 +14,12 @@ def setup_logging() -> None:
     logger.remove()
 
     # Add stderr handler with appropriate log level
+    # enqueue=True hands records to a background thread so callers don't block on I/O
     logger.add(
         sys.stderr,
         level=settings.LOG_LEVEL,
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
+        enqueue=True
     )
 
     # Add file handler if configured
@@ -26,8 +28,10 @@ def setup_logging() -> None:
             settings.LOG_FILE,
             rotation="1 week",
             retention="1 month",
-            compression="zip",
-            level=settings.LOG_LEVEL
+            compression="gz",
+            level=settings.LOG_LEVEL,
+            enqueue=True,
+            buffering=65536
         )
 
 
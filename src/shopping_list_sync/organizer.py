@@ -1,14 +1,119 @@
 """Shopping list organization using OpenAI categorization."""
 
+import json
+import random
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set
 
+import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 from openai import OpenAI
-from todoist_api_python.api import TodoistAPI, Task
+from tenacity import (
+    RetryCallState,
+    retry,
+    stop_after_attempt,
+    wait_exponential_jitter,
+    retry_if_exception,
+    before_sleep_log
+)
+from todoist_api_python.api import Project, TodoistAPI, Task
 
 from shopping_list_sync.config import settings, load_categories
 
+# Todoist Sync API endpoint used to batch write commands
+TODOIST_SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+# Maximum number of commands Todoist accepts per Sync API request
+SYNC_COMMAND_BATCH_SIZE = 100
+# Concurrent REST calls for the per-item fallback, well within Todoist rate limits
+FALLBACK_MAX_WORKERS = 8
+
+# (categories_config, prompt) for the most recently built system prompt
+_system_prompt_cache: Optional[tuple[Dict, str]] = None
+
+
+def create_todoist_session() -> requests.Session:
+    """Create an HTTP session with a small keep-alive connection pool for Todoist requests."""
+    session = requests.Session()
+    # Retries are handled by tenacity, not urllib3
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by all Todoist REST and Sync API requests so TLS connections are reused
+todoist_session = create_todoist_session()
+
+
+def is_retryable_todoist_error(error: BaseException) -> bool:
+    """Check whether a failed Todoist request is worth retrying.
+
+    Connection problems, timeouts, rate limiting (429) and server errors (5xx) are transient;
+    other HTTP errors such as 404 are not.
+    """
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, requests.exceptions.HTTPError):
+        if error.response is None:
+            return True
+        status_code = error.response.status_code
+        return status_code == 429 or status_code >= 500
+    return False
+
+
+_default_todoist_wait = wait_exponential_jitter(initial=1, max=10, jitter=2)
+
+
+def wait_for_todoist_retry(retry_state: RetryCallState) -> float:
+    """Compute the delay before retrying a Todoist call.
+
+    Honors the Retry-After header of rate-limited (429) responses, adding up to a second of
+    jitter; otherwise falls back to jittered exponential backoff.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        retry_after = error.response.headers.get('Retry-After')
+        if error.response.status_code == 429 and retry_after:
+            try:
+                return float(retry_after) + random.uniform(0, 1)
+            except ValueError:
+                logger.debug("Ignoring non-numeric Retry-After header: {}", retry_after)
+    return float(_default_todoist_wait(retry_state))
+
+
+def create_todoist_retry_decorator():
+    """Create a retry decorator for Todoist API calls."""
+    return retry(
+        retry=retry_if_exception(is_retryable_todoist_error),
+        wait=wait_for_todoist_retry,
+        stop=stop_after_attempt(3),
+        before_sleep=before_sleep_log(logger, log_level="WARNING"),
+        reraise=True
+    )
+
+
+@lru_cache(maxsize=1)
+def _todoist_auth_headers(api_key: str) -> Dict[str, str]:
+    """Build the Authorization header for Todoist requests."""
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+def post_sync(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Send a request to the Todoist Sync API and return the decoded response."""
+    response = todoist_session.post(
+        TODOIST_SYNC_URL,
+        headers=_todoist_auth_headers(settings.TODOIST_API_KEY),
+        data=data,
+        timeout=30
+    )
+    response.raise_for_status()
+    result: Dict[str, Any] = response.json()
+    return result
+
 
 def create_error_task(todoist_client: TodoistAPI, error_message: str) -> None:
     """Create a task in Todoist for an error that needs attention.
@@ -50,70 +155,129 @@ def create_error_task(todoist_client: TodoistAPI, error_message: str) -> None:
         logger.error(f"Failed to create error task in Todoist: {e}")
 
 
+def normalize_project_name(name: str) -> str:
+    """Normalize a project name for case- and whitespace-insensitive matching."""
+    return name.strip().casefold()
+
+
+def find_shopping_project_id(
+    project_names: Dict[str, str],
+    project_id: Optional[str],
+    project_name: str
+) -> Optional[str]:
+    """Pick the shopping list project out of the active projects.
+
+    Args:
+        project_names: Active project IDs mapped to project names, in Todoist order
+        project_id: Configured project ID, preferred when it is among the projects
+        project_name: Configured project name, matched ignoring case and surrounding whitespace
+
+    Returns:
+        The shopping project ID, or None if no project matches
+    """
+    if project_id:
+        if project_id in project_names:
+            return project_id
+        logger.warning(f"Shopping list project with ID {project_id} not found, falling back to name search...")
+
+    # Index by normalized name; setdefault so the first matching project wins
+    project_ids_by_name: Dict[str, str] = {}
+    for pid, name in project_names.items():
+        project_ids_by_name.setdefault(normalize_project_name(name), pid)
+    return project_ids_by_name.get(normalize_project_name(project_name))
+
+
+def lookup_shopping_project_id(
+    todoist_client: TodoistAPI,
+    project_id: Optional[str],
+    project_name: str
+) -> Optional[str]:
+    """Look up the shopping list project through the REST API.
+
+    A configured project ID is confirmed with a single get_project request; the full project
+    list is only fetched when no ID is configured or the project no longer exists.
+
+    Returns:
+        The shopping project ID, or None if no project matches
+    """
+    if project_id:
+        try:
+            project: Project = todoist_client.get_project(project_id=project_id)
+            return project.id
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+
+    projects = todoist_client.get_projects()
+    return find_shopping_project_id({p.id: p.name for p in projects}, project_id, project_name)
+
+
+def _resolve_shopping_project_id(todoist_client: TodoistAPI) -> str:
+    """Find the shopping list project by configured ID or name, creating it if missing."""
+    project_id = lookup_shopping_project_id(
+        todoist_client,
+        settings.TODOIST_SHOPPING_PROJECT_ID,
+        settings.TODOIST_SHOPPING_PROJECT_NAME
+    )
+    if project_id:
+        return project_id
+
+    logger.warning(
+        f"Shopping list project '{settings.TODOIST_SHOPPING_PROJECT_NAME}' not found, creating it..."
+    )
+    shopping_project: Project = todoist_client.add_project(name=settings.TODOIST_SHOPPING_PROJECT_NAME)
+    return shopping_project.id
+
+
 def setup_todoist_resources(
     todoist_client: TodoistAPI,
-    categories_config: Dict
+    categories_config: Dict,
+    project_id: Optional[str] = None
 ) -> tuple[str, Dict[str, str]]:
     """Set up required Todoist projects and sections based on configuration.
 
     Args:
         todoist_client: Initialized Todoist API client
         categories_config: Category configuration from YAML
+        project_id: Already resolved shopping project ID; skips the project lookup when given
 
     Returns:
         Tuple of (project_id, section_dict) where section_dict maps category names to section IDs
     """
-    # Get or create shopping list project
-    if settings.TODOIST_SHOPPING_PROJECT_ID:
+    sections = None
+    if project_id:
         try:
-            shopping_project = todoist_client.get_project(
-                project_id=settings.TODOIST_SHOPPING_PROJECT_ID
-            )
-        except Exception:
-            logger.warning(
-                f"Shopping list project with ID {settings.TODOIST_SHOPPING_PROJECT_ID} not found, "
-                f"falling back to name search..."
-            )
-            shopping_project = None
-    else:
-        shopping_project = None
-
-    if not shopping_project:
-        projects = todoist_client.get_projects()
-        shopping_project = next(
-            (p for p in projects if p.name == settings.TODOIST_SHOPPING_PROJECT_NAME),
-            None
-        )
+            sections = todoist_client.get_sections(project_id=project_id)
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            logger.warning(f"Shopping list project {project_id} no longer exists, resolving it again...")
 
-    if not shopping_project:
-        logger.warning(
-            f"Shopping list project '{settings.TODOIST_SHOPPING_PROJECT_NAME}' not found, creating it..."
-        )
-        shopping_project = todoist_client.add_project(name=settings.TODOIST_SHOPPING_PROJECT_NAME)
+    # Get or create shopping list project
+    if sections is None or not project_id:
+        project_id = _resolve_shopping_project_id(todoist_client)
+        sections = todoist_client.get_sections(project_id=project_id)
 
-    # Get existing sections
-    sections = todoist_client.get_sections(project_id=shopping_project.id)
+    sections_by_name = {s.name: s for s in sections}
     section_dict = {}
 
     # Create or get sections based on YAML config
     for category_key, category_config in categories_config.items():
-        emoji = category_config['emoji']
-        # Convert category key to title case (e.g., "meat_seafood" -> "Meat Seafood")
-        category_name = category_key.replace('_', ' ').title()
-        section_name = f"{emoji} {category_name}"
+        section_name = category_config['_section_name']
 
-        section = next((s for s in sections if s.name == section_name), None)
+        section = sections_by_name.get(section_name)
 
         if not section:
             logger.info(f"Section '{section_name}' not found, creating it...")
             section = todoist_client.add_section(
-                project_id=shopping_project.id,
+                project_id=project_id,
                 name=section_name
             )
+            sections_by_name[section_name] = section
 
         section_dict[category_key] = section.id
 
-    return shopping_project.id, section_dict
+    return project_id, section_dict
 
 
 def get_unlabeled_items(todoist_client: TodoistAPI, project_id: str) -> List[Task]:
@@ -122,29 +286,74 @@ def get_unlabeled_items(todoist_client: TodoistAPI, project_id: str) -> List[Tas
     return [task for task in tasks if not task.section_id and not task.parent_id]
 
 
-def categorize_items(
-    openai_client: OpenAI,
-    items: List[Task],
-    categories_config: Dict
+def _map_categories_to_tasks(
+    category_to_items: Dict[str, List[str]],
+    items: List[Task]
 ) -> Dict[str, List[Task]]:
-    """Categorize shopping items using OpenAI.
+    """Map item names returned by OpenAI back to their Task objects.
+
+    Names are matched exactly (case-insensitive) first; names without an exact match
+    are combined into a single regex and searched for as substrings of the task contents.
 
     Args:
-        openai_client: Initialized OpenAI client
-        items: List of uncategorized tasks
-        categories_config: Category configuration from YAML
+        category_to_items: Category names (Title Case) mapped to item names
+        items: Tasks that were sent for categorization
 
     Returns:
-        Dictionary mapping category keys to lists of tasks
+        Dictionary mapping category keys (snake_case) to lists of tasks
     """
-    if not items:
-        return {}
+    lowered = [(task, task.content.lower().strip()) for task in items]
+    exact: Dict[str, List[Task]] = {}
+    for task, content in lowered:
+        exact.setdefault(content, []).append(task)
+
+    categorized_items = {}
+    for category_name, item_names in category_to_items.items():
+        # Convert category name back to snake_case key
+        category_key = category_name.lower().replace(' ', '_')
+
+        matching_tasks = []
+        seen_ids: Set[str] = set()
+        unmatched_names = []
+        for item_name in item_names:
+            name = item_name.lower().strip()
+            if name in exact:
+                for task in exact[name]:
+                    if task.id not in seen_ids:
+                        seen_ids.add(task.id)
+                        matching_tasks.append(task)
+            elif name:
+                unmatched_names.append(name)
+
+        # Scan each task once against all remaining names combined into one pattern
+        if unmatched_names:
+            pattern = re.compile('|'.join(re.escape(name) for name in unmatched_names))
+            for task, content in lowered:
+                if task.id not in seen_ids and pattern.search(content):
+                    seen_ids.add(task.id)
+                    matching_tasks.append(task)
+
+        if matching_tasks:
+            categorized_items[category_key] = matching_tasks
+
+    return categorized_items
+
+
+def build_system_prompt(categories_config: Dict) -> str:
+    """Build the categorization system prompt for a categories configuration.
+
+    The prompt is cached for the most recently used configuration; load_categories
+    returns the same dict until categories.yaml changes, so it is built once per load.
+    """
+    global _system_prompt_cache
+    if _system_prompt_cache is not None and _system_prompt_cache[0] is categories_config:
+        return _system_prompt_cache[1]
 
     # Build category descriptions from config
     categories_desc = []
     for category_key, category_config in categories_config.items():
         emoji = category_config['emoji']
-        category_name = category_key.replace('_', ' ').title()
+        category_name = category_config['_display_name']
         keywords = category_config.get('keywords', [])
         keywords_str = ', '.join(keywords[:5]) if keywords else ''
         desc = f"- {category_name} ({emoji})"
@@ -154,9 +363,6 @@ def categorize_items(
 
     categories_list = '\n'.join(categories_desc)
 
-    # Prepare items for OpenAI
-    items_text = "\n".join(f"- {task.content}" for task in items)
-
     system_prompt = f"""You are a helpful shopping list assistant. Your task is to categorize shopping items into supermarket sections.
 
 Use these categories ONLY:
@@ -164,6 +370,33 @@ Use these categories ONLY:
 
 For items that don't fit any category, use "Other"."""
 
+    _system_prompt_cache = (categories_config, system_prompt)
+    return system_prompt
+
+
+def categorize_items(
+    openai_client: OpenAI,
+    items: List[Task],
+    categories_config: Dict
+) -> Dict[str, List[Task]]:
+    """Categorize shopping items using OpenAI.
+
+    Args:
+        openai_client: Initialized OpenAI client
+        items: List of uncategorized tasks
+        categories_config: Category configuration from YAML
+
+    Returns:
+        Dictionary mapping category keys to lists of tasks
+    """
+    if not items:
+        return {}
+
+    # Prepare items for OpenAI
+    items_text = "\n".join(f"- {task.content}" for task in items)
+
+    system_prompt = build_system_prompt(categories_config)
+
     user_prompt = f"""Here are the shopping items:
 
 {items_text}
@@ -189,58 +422,189 @@ Only include categories that have items. Match items EXACTLY as provided. Use ca
         )
 
         response_data = completion.choices[0].message.content
-        category_to_items = eval(response_data)  # Safe since we specified json_object format
-
-        # Map items back to their Task objects
-        # Need to match category names from JSON (Title Case) to config keys (snake_case)
-        categorized_items = {}
-        for category_name, item_names in category_to_items.items():
-            # Convert category name back to snake_case key
-            category_key = category_name.lower().replace(' ', '_')
+        category_to_items = json.loads(response_data)  # Guaranteed JSON by json_object format
 
-            # Find matching tasks
-            matching_tasks = [
-                task for task in items
-                if any(item.lower() in task.content.lower() for item in item_names)
-            ]
-            if matching_tasks:
-                categorized_items[category_key] = matching_tasks
-
-        return categorized_items
+        return _map_categories_to_tasks(category_to_items, items)
 
     except Exception as e:
         logger.error(f"Failed to categorize items using OpenAI: {e}")
         raise
 
 
-def get_existing_items(todoist_client: TodoistAPI, project_id: str) -> List[str]:
-    """Get a list of items already in the shopping list (normalized for comparison)."""
+def get_existing_items(todoist_client: TodoistAPI, project_id: str) -> Set[str]:
+    """Get the set of items already in the shopping list (normalized for comparison)."""
     tasks = todoist_client.get_tasks(project_id=project_id)
     # Normalize strings: lowercase and stripped
-    return [
+    return {
         task.content.lower().strip()
         for task in tasks
         if task.section_id or task.parent_id
+    }
+
+
+@create_todoist_retry_decorator()
+def _post_sync_commands(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Send one batch of write commands; Todoist skips commands whose UUID it already applied."""
+    return post_sync({"commands": json.dumps(batch)})
+
+
+def _run_sync_commands(commands: List[Dict[str, Any]]) -> Dict[str, object]:
+    """Send write commands to the Todoist Sync API in batches.
+
+    Args:
+        commands: Sync API commands, each with a unique 'uuid'
+
+    Returns:
+        Dictionary mapping command UUIDs to their status ("ok" or an error description)
+
+    Raises:
+        requests.exceptions.RequestException: If a batch still fails after retrying; its
+            commands may or may not have been applied, so they are not reported as failed
+    """
+    statuses: Dict[str, object] = {}
+    for start in range(0, len(commands), SYNC_COMMAND_BATCH_SIZE):
+        batch = commands[start:start + SYNC_COMMAND_BATCH_SIZE]
+        try:
+            statuses.update(_post_sync_commands(batch).get('sync_status', {}))
+        except Exception as e:
+            logger.error(f"Todoist Sync API request failed for {len(batch)} commands: {e}")
+            raise
+    return statuses
+
+
+def move_tasks(moves: List[tuple[Task, str]]) -> List[tuple[Task, str, object]]:
+    """Move tasks to sections using batched Sync API commands.
+
+    Args:
+        moves: List of (task, section_id) pairs
+
+    Returns:
+        List of (task, section_id, error) for moves that Todoist rejected
+    """
+    commands: List[Dict[str, Any]] = [
+        {
+            "type": "item_move",
+            "uuid": str(uuid.uuid4()),
+            "args": {"id": task.id, "section_id": section_id}
+        }
+        for task, section_id in moves
+    ]
+    statuses = _run_sync_commands(commands)
+
+    failed = []
+    for (task, section_id), command in zip(moves, commands):
+        status = statuses.get(command['uuid'], "no status returned")
+        if status != "ok":
+            failed.append((task, section_id, status))
+    return failed
+
+
+def delete_tasks(tasks: List[Task]) -> List[tuple[Task, object]]:
+    """Delete tasks using batched Sync API commands.
+
+    Returns:
+        List of (task, error) for deletions that Todoist rejected
+    """
+    commands: List[Dict[str, Any]] = [
+        {"type": "item_delete", "uuid": str(uuid.uuid4()), "args": {"id": task.id}}
+        for task in tasks
     ]
+    statuses = _run_sync_commands(commands)
+
+    failed = []
+    for task, command in zip(tasks, commands):
+        status = statuses.get(command['uuid'], "no status returned")
+        if status != "ok":
+            failed.append((task, status))
+    return failed
+
+
+def _recreate_task_in_section(
+    todoist_client: TodoistAPI,
+    item: Task,
+    project_id: str,
+    section_id: str,
+    category_name: str
+) -> None:
+    """Fallback for a failed move: recreate the task in the target section and delete the original."""
+    try:
+        logger.info(f"Attempting to recreate task {item.content} in new section...")
+        new_task = todoist_client.add_task(
+            content=item.content,
+            project_id=project_id,
+            section_id=section_id
+        )
+        logger.info(f"Created new task in {category_name}: {new_task.content}")
+
+        try:
+            todoist_client.delete_task(task_id=item.id)
+            logger.info(f"Deleted original task: {item.content}")
+        except Exception as delete_error:
+            logger.warning(f"Failed to delete original task {item.content}: {delete_error}")
+    except Exception as add_error:
+        logger.error(f"Failed to create new task for {item.content}: {add_error}")
+
+
+def _partition_tasks(tasks: Iterable[Task]) -> tuple[List[Task], Set[str]]:
+    """Split tasks into unlabeled items and normalized existing item names in a single pass.
+
+    Accepts any iterable, so paginated task results can be consumed as they stream in;
+    categorized tasks are reduced to their normalized content and not retained.
+
+    Returns:
+        Tuple of (unlabeled_items, existing_items), matching get_unlabeled_items
+        and get_existing_items respectively
+    """
+    unlabeled_items = []
+    existing_items = set()
+    for task in tasks:
+        if task.section_id or task.parent_id:
+            existing_items.add(task.content.lower().strip())
+        else:
+            unlabeled_items.append(task)
+    return unlabeled_items, existing_items
+
+
+def create_openai_client(todoist_client: TodoistAPI) -> Optional[OpenAI]:
+    """Create an OpenAI client, reporting failures according to ERROR_HANDLING_MODE.
+
+    Returns:
+        The OpenAI client, or None if it could not be initialized
+    """
+    try:
+        return OpenAI(api_key=settings.OPENAI_API_KEY)
+    except Exception as e:
+        logger.error(f"Failed to initialize OpenAI client: {e}")
+        if settings.ERROR_HANDLING_MODE in ('log', 'both'):
+            logger.error(f"OpenAI initialization error: {str(e)}")
+        if settings.ERROR_HANDLING_MODE in ('task', 'both'):
+            create_error_task(todoist_client, f"Failed to initialize OpenAI client: {str(e)}")
+        return None
 
 
-def organize_shopping_list():
-    """Main function to organize the shopping list."""
+def organize_shopping_list(
+    todoist_client: Optional[TodoistAPI] = None,
+    openai_client: Optional[OpenAI] = None,
+    project_id: Optional[str] = None
+):
+    """Main function to organize the shopping list.
+
+    Args:
+        todoist_client: Todoist API client to reuse; a new one is created when omitted
+        openai_client: OpenAI client to reuse; a new one is created when omitted
+        project_id: Already resolved shopping project ID; looked up (or created) when omitted
+    """
     try:
         logger.info("Starting shopping list organization...")
 
-        # Initialize API clients
-        todoist_client = TodoistAPI(settings.TODOIST_API_KEY)
+        # Initialize API clients unless the caller provides long-lived ones
+        if todoist_client is None:
+            todoist_client = TodoistAPI(settings.TODOIST_API_KEY, session=todoist_session)
 
-        try:
-            openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        except Exception as e:
-            logger.error(f"Failed to initialize OpenAI client: {e}")
-            if settings.ERROR_HANDLING_MODE in ('log', 'both'):
-                logger.error(f"OpenAI initialization error: {str(e)}")
-            if settings.ERROR_HANDLING_MODE in ('task', 'both'):
-                create_error_task(todoist_client, f"Failed to initialize OpenAI client: {str(e)}")
-            return
+        if openai_client is None:
+            openai_client = create_openai_client(todoist_client)
+            if openai_client is None:
+                return
 
         # Load categories from YAML
         try:
@@ -250,33 +614,42 @@ def organize_shopping_list():
             return
 
         # Set up Todoist resources
-        project_id, section_dict = setup_todoist_resources(todoist_client, categories_config)
+        project_id, section_dict = setup_todoist_resources(
+            todoist_client,
+            categories_config,
+            project_id
+        )
 
-        # Get unlabeled items
-        unlabeled_items = get_unlabeled_items(todoist_client, project_id)
+        # Fetch tasks once and split into unlabeled and already categorized items
+        unlabeled_items, existing_items = _partition_tasks(
+            todoist_client.get_tasks(project_id=project_id)
+        )
         if not unlabeled_items:
             logger.info("No unlabeled items found in shopping list.")
             return
 
         logger.info(f"Found {len(unlabeled_items)} unlabeled items")
 
-        # Get existing categorized items for duplicate checking
-        existing_items = get_existing_items(todoist_client, project_id)
-
         # Filter out duplicates
         unique_unlabeled_items = []
+        duplicate_items = []
         for item in unlabeled_items:
             normalized_content = item.content.lower().strip()
             if normalized_content in existing_items:
                 logger.info(f"Duplicate item found: '{item.content}'. Deleting...")
-                try:
-                    todoist_client.delete_task(task_id=item.id)
-                    logger.info(f"Deleted duplicate item: {item.content}")
-                except Exception as e:
-                    logger.error(f"Failed to delete duplicate item {item.content}: {e}")
+                duplicate_items.append(item)
             else:
                 unique_unlabeled_items.append(item)
 
+        if duplicate_items:
+            failed_deletes = delete_tasks(duplicate_items)
+            failed_ids = {item.id for item, _ in failed_deletes}
+            for item, error in failed_deletes:
+                logger.error(f"Failed to delete duplicate item {item.content}: {error}")
+            for item in duplicate_items:
+                if item.id not in failed_ids:
+                    logger.info(f"Deleted duplicate item: {item.content}")
+
         if not unique_unlabeled_items:
             logger.info("All new items were duplicates. Nothing to categorize.")
             return
@@ -298,46 +671,47 @@ def organize_shopping_list():
                 create_error_task(todoist_client, f"Failed to categorize items using OpenAI: {str(e)}")
             return
 
-        # Move items to their sections
-        for category_key, items in categorized_items.items():
-            if items and category_key in section_dict:
-                section_id = section_dict[category_key]
-                category_name = category_key.replace('_', ' ').title()
-
-                for item in items:
-                    try:
-                        todoist_client.update_task(
-                            task_id=item.id,
-                            section_id=section_id
-                        )
-                        logger.info(f"Moved item to {category_name}: {item.content}")
-                    except Exception as e:
-                        logger.error(f"Failed to move item {item.content} to section {section_id}: {e}")
-                        # Try recreation as fallback
-                        try:
-                            logger.info(f"Attempting to recreate task {item.content} in new section...")
-                            new_task = todoist_client.add_task(
-                                content=item.content,
-                                project_id=project_id,
-                                section_id=section_id
-                            )
-                            logger.info(f"Created new task in {category_name}: {new_task.content}")
-
-                            try:
-                                todoist_client.delete_task(task_id=item.id)
-                                logger.info(f"Deleted original task: {item.content}")
-                            except Exception as delete_error:
-                                logger.warning(f"Failed to delete original task {item.content}: {delete_error}")
-                        except Exception as add_error:
-                            logger.error(f"Failed to create new task for {item.content}: {add_error}")
-                            continue
+        # Move items to their sections in batched Sync API requests
+        moves = [
+            (item, section_dict[category_key])
+            for category_key, items in categorized_items.items()
+            if category_key in section_dict
+            for item in items
+        ]
+        category_names = {
+            section_dict[category_key]: categories_config[category_key]['_display_name']
+            for category_key in categorized_items
+            if category_key in section_dict
+        }
+
+        failed_moves = move_tasks(moves)
+        failed_ids = {item.id for item, _, _ in failed_moves}
+        for item, section_id in moves:
+            if item.id not in failed_ids:
+                logger.info(f"Moved item to {category_names[section_id]}: {item.content}")
+
+        for item, section_id, error in failed_moves:
+            logger.error(f"Failed to move item {item.content} to section {section_id}: {error}")
+
+        # Try recreation as fallback; the REST calls are network-bound, so run them concurrently
+        if failed_moves:
+            with ThreadPoolExecutor(max_workers=FALLBACK_MAX_WORKERS) as executor:
+                for item, section_id, _ in failed_moves:
+                    executor.submit(
+                        _recreate_task_in_section,
+                        todoist_client,
+                        item,
+                        project_id,
+                        section_id,
+                        category_names[section_id]
+                    )
 
         logger.info("Shopping list organization completed successfully!")
 
     except Exception as e:
         logger.error(f"Failed to organize shopping list: {e}")
         logger.exception(e)
-        if 'todoist_client' in locals():
+        if todoist_client is not None:
             if settings.ERROR_HANDLING_MODE in ('task', 'both'):
                 create_error_task(todoist_client, f"Failed to organize shopping list: {str(e)}")
         raise
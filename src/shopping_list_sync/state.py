@@ -1,12 +1,80 @@
 """State management for tracking Todoist sync changes."""
 
+import hashlib
 import json
-from datetime import datetime
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Set, Tuple
 
 from loguru import logger
 
+# orjson is optional; fall back to the stdlib json module when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(data: Dict) -> bytes:
+    """Serialize state data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def compute_tasks_digest(rows: Iterable[Tuple[str, str, Optional[str], bool]]) -> bytes:
+    """Compute a compact digest of task states.
+
+    Args:
+        rows: (task_id, content, section_id, is_completed) tuples, sorted by task_id
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for task_id, content, section_id, is_completed in rows:
+        # Unit/record separators keep field boundaries unambiguous
+        digest.update(f"{task_id}\x1f{content}\x1f{section_id}\x1f{int(bool(is_completed))}\x1e".encode())
+    return digest.digest()
+
+
+def _digest(tasks_state: Dict) -> bytes:
+    """Compute the digest of a task_id -> {content, section_id, is_completed} mapping."""
+    return compute_tasks_digest(
+        (task_id, task['content'], task['section_id'], task['is_completed'])
+        for task_id, task in sorted(tasks_state.items())
+    )
+
+
+def _loads(raw: bytes) -> Dict:
+    """Deserialize state data from JSON bytes."""
+    data: Dict = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return data
+
+
+@dataclass
+class StateDiff:
+    """Task IDs grouped by how they differ between the stored and current state."""
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    moved: Set[str] = field(default_factory=set)  # section_id changed
+    edited: Set[str] = field(default_factory=set)  # content changed
+    completed: Set[str] = field(default_factory=set)  # is_completed toggled
+    unsectioned: Set[str] = field(default_factory=set)  # current tasks without a section
+
+    @property
+    def needs_organizing(self) -> bool:
+        """Whether the changes can leave items that the organizer has to categorize.
+
+        The organizer only acts on tasks without a section, so only added, moved or edited tasks
+        that are currently unsectioned count. Removed (including completed and deleted) tasks,
+        completion toggles and moves into a section, such as the organizer's own, never do.
+        """
+        return not self.unsectioned.isdisjoint(self.added | self.moved | self.edited)
+
 
 class SyncState:
     """Manages synchronization state for Todoist tasks."""
@@ -20,23 +88,25 @@ class SyncState:
         self.state_file = Path(state_file)
         self.tasks_state: Dict = {}  # task_id -> {content, section_id, is_completed}
         self.last_sync: Optional[datetime] = None
+        self._state_hash: bytes = _digest(self.tasks_state)
 
     def load(self) -> None:
         """Load state from JSON file."""
         try:
             if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    self.tasks_state = data.get('tasks', {})
-                    last_sync_str = data.get('last_sync')
-                    if last_sync_str:
-                        self.last_sync = datetime.fromisoformat(last_sync_str)
+                data = _loads(self.state_file.read_bytes())
+                self.tasks_state = data.get('tasks', {})
+                last_sync_str = data.get('last_sync')
+                if last_sync_str:
+                    self.last_sync = datetime.fromisoformat(last_sync_str)
+                self._state_hash = _digest(self.tasks_state)
                 logger.debug(f"Loaded state with {len(self.tasks_state)} tasks")
         except Exception as e:
             logger.error(f"Failed to load state from {self.state_file}: {e}")
             # Start with empty state if loading fails
             self.tasks_state = {}
             self.last_sync = None
+            self._state_hash = _digest(self.tasks_state)
 
     def save(self) -> None:
         """Save state to JSON file with atomic write."""
@@ -51,8 +121,12 @@ class SyncState:
                 'last_sync': self.last_sync.isoformat() if self.last_sync else None
             }
 
-            with open(temp_file, 'w') as f:
-                json.dump(state_dict, f, indent=2)
+            # Serialize up front so the file is written with a single call
+            payload = _dumps(state_dict)
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
 
             # Rename temp file to actual file (atomic operation)
             temp_file.replace(self.state_file)
@@ -62,16 +136,49 @@ class SyncState:
             logger.error(f"Failed to save state to {self.state_file}: {e}")
             raise
 
+    @property
+    def digest(self) -> bytes:
+        """Digest of the stored task states, as computed by compute_tasks_digest."""
+        return self._state_hash
+
     def has_changed(self, current_state: Dict) -> bool:
         """Check if the current state differs from stored state.
 
+        Compares digests of the serialized states rather than walking both dicts.
+
         Args:
             current_state: Dictionary of current task states
 
         Returns:
             True if state has changed, False otherwise
         """
-        return current_state != self.tasks_state
+        return _digest(current_state) != self._state_hash
+
+    def diff(self, current_state: Dict) -> StateDiff:
+        """Classify how the current state differs from stored state.
+
+        Args:
+            current_state: Dictionary of current task states
+
+        Returns:
+            StateDiff with the affected task IDs
+        """
+        result = StateDiff(
+            added=current_state.keys() - self.tasks_state.keys(),
+            removed=self.tasks_state.keys() - current_state.keys(),
+            unsectioned={
+                task_id for task_id, task in current_state.items() if task['section_id'] is None
+            }
+        )
+        for task_id in current_state.keys() & self.tasks_state.keys():
+            current, stored = current_state[task_id], self.tasks_state[task_id]
+            if current['section_id'] != stored['section_id']:
+                result.moved.add(task_id)
+            if current['content'] != stored['content']:
+                result.edited.add(task_id)
+            if current['is_completed'] != stored['is_completed']:
+                result.completed.add(task_id)
+        return result
 
     def update(self, new_state: Dict) -> None:
         """Update state with new task information.
@@ -80,4 +187,5 @@ class SyncState:
             new_state: Dictionary of new task states
         """
         self.tasks_state = new_state
-        self.last_sync = datetime.utcnow()
+        self._state_hash = _digest(new_state)
+        self.last_sync = datetime.now(timezone.utc)
@@ -1,41 +1,55 @@
 """Todoist synchronization module for Shopping List Sync."""
 
+import copy
+import json
 import os
+import queue
+import random
 import signal
-import sys
 import threading
 import time
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
-from apscheduler.schedulers.background import BackgroundScheduler
 from loguru import logger
+from openai import OpenAI
 from todoist_api_python.api import TodoistAPI
 import requests
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-    before_sleep_log
-)
 
 from shopping_list_sync.config import settings
-from shopping_list_sync.organizer import organize_shopping_list
-from shopping_list_sync.state import SyncState
+from shopping_list_sync.organizer import (
+    create_openai_client,
+    create_todoist_retry_decorator,
+    find_shopping_project_id,
+    lookup_shopping_project_id,
+    organize_shopping_list,
+    post_sync,
+    todoist_session
+)
+from shopping_list_sync.state import SyncState, compute_tasks_digest
+
+if TYPE_CHECKING:
+    from apscheduler.schedulers.blocking import BlockingScheduler
+
+# Upper bound for the organizer circuit breaker backoff
+MAX_ORGANIZE_BACKOFF_SECONDS = 3600
+
+# How long a resolved shopping project is reused before it is looked up again
+PROJECT_ID_TTL_SECONDS = 3600
 
+# Sync API error tag for a sync_token the server no longer accepts
+INVALID_SYNC_TOKEN_ERROR_TAG = "INVALID_SYNC_TOKEN"
 
-def create_todoist_retry_decorator():
-    """Create a retry decorator for Todoist API calls."""
-    return retry(
-        retry=retry_if_exception_type((
-            requests.exceptions.HTTPError,
-            requests.exceptions.ConnectionError
-        )),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        stop=stop_after_attempt(3),
-        before_sleep=before_sleep_log(logger, log_level="WARNING"),
-        reraise=True
-    )
+
+def is_invalid_sync_token_error(error: requests.exceptions.HTTPError) -> bool:
+    """Check whether the Sync API rejected the sync_token of an incremental sync."""
+    if error.response is None or error.response.status_code != 400:
+        return False
+    try:
+        body = error.response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get('error_tag') == INVALID_SYNC_TOKEN_ERROR_TAG
 
 
 class ShoppingListSync:
@@ -49,97 +63,283 @@ class ShoppingListSync:
         """
         self.sync_interval = sync_interval or settings.SYNC_INTERVAL_SECONDS
         self.state = SyncState(str(settings.STATE_FILE))
-        self.todoist_client = TodoistAPI(settings.TODOIST_API_KEY)
+        self.todoist_client = TodoistAPI(settings.TODOIST_API_KEY, session=todoist_session)
+
+        # Settings read on every sync, bound once
+        self._project_name = settings.TODOIST_SHOPPING_PROJECT_NAME
+        self._project_id_cfg = settings.TODOIST_SHOPPING_PROJECT_ID
+
+        self._openai_client: Optional[OpenAI] = None
+        self._sync_token = "*"
+        self._items: Dict[str, Dict] = {}  # item_id -> active Sync API item, across all projects
+        self._cached_project_id: Optional[str] = None
+        self._project_cached_at: float = 0
+        self._consecutive_organize_failures = 0
+        self._circuit_open_until: float = 0
         self._lock = threading.Lock()
-        self._scheduler: Optional[BackgroundScheduler] = None
+        self._scheduler: Optional["BlockingScheduler"] = None
+
+        # State snapshots are written by a single background thread, off the sync tick
+        self._save_queue: "queue.Queue[SyncState]" = queue.Queue()
+        self._save_error: Optional[Exception] = None
+        self._save_thread = threading.Thread(
+            target=self._save_worker,
+            name="sync-state-writer",
+            daemon=True
+        )
+        self._save_thread.start()
 
         # Load existing state
         self.state.load()
 
+    def _save_worker(self) -> None:
+        """Write queued state snapshots to disk, skipping any superseded by a newer one."""
+        while True:
+            snapshot = self._save_queue.get()
+            try:
+                # Last write wins: only the newest queued snapshot needs to hit the disk
+                while True:
+                    try:
+                        newer = self._save_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    self._save_queue.task_done()
+                    snapshot = newer
+                snapshot.save()
+                self._save_error = None
+            except Exception as e:
+                # SyncState.save already logged the failure; keep the writer alive and report
+                # the failure from flush_state
+                self._save_error = e
+            finally:
+                self._save_queue.task_done()
+
+    def _queue_state_save(self) -> None:
+        """Schedule the current state to be saved by the background writer."""
+        self._save_queue.put(copy.copy(self.state))
+
+    def flush_state(self) -> None:
+        """Block until all queued state snapshots have been written.
+
+        Raises:
+            Exception: The error of the last save, if the newest snapshot could not be written
+        """
+        self._save_queue.join()
+        error, self._save_error = self._save_error, None
+        if error is not None:
+            raise error
+
+    def _get_openai_client(self) -> Optional[OpenAI]:
+        """Get the OpenAI client, creating it on first use and reusing it afterwards."""
+        if self._openai_client is None:
+            self._openai_client = create_openai_client(self.todoist_client)
+        return self._openai_client
+
+    def _cache_project_id(self, project_id: str) -> None:
+        """Remember a resolved shopping project ID."""
+        self._cached_project_id = project_id
+        self._project_cached_at = time.monotonic()
+
+    def _fresh_cached_project_id(self) -> Optional[str]:
+        """Get the cached shopping project ID, or None if it expired or was never resolved."""
+        if time.monotonic() - self._project_cached_at < PROJECT_ID_TTL_SECONDS:
+            return self._cached_project_id
+        return None
+
     @create_todoist_retry_decorator()
     def _get_shopping_project_id(self) -> Optional[str]:
-        """Get the shopping list project ID."""
-        try:
-            # Try ID first if configured
-            if settings.TODOIST_SHOPPING_PROJECT_ID:
-                try:
-                    project = self.todoist_client.get_project(
-                        project_id=settings.TODOIST_SHOPPING_PROJECT_ID
-                    )
-                    return project.id
-                except Exception:
-                    logger.warning(
-                        f"Project ID {settings.TODOIST_SHOPPING_PROJECT_ID} not found, "
-                        f"falling back to name search"
-                    )
+        """Look up the shopping list project ID.
 
-            # Fall back to name search
-            projects = self.todoist_client.get_projects()
-            shopping_project = next(
-                (p for p in projects if p.name == settings.TODOIST_SHOPPING_PROJECT_NAME),
-                None
+        The resolved ID is cached for PROJECT_ID_TTL_SECONDS to avoid a lookup on every sync.
+        """
+        cached_project_id = self._fresh_cached_project_id()
+        if cached_project_id:
+            return cached_project_id
+
+        try:
+            project_id = lookup_shopping_project_id(
+                self.todoist_client,
+                self._project_id_cfg,
+                self._project_name
             )
-            return shopping_project.id if shopping_project else None
+            if project_id:
+                self._cache_project_id(project_id)
+            return project_id
         except Exception as e:
-            logger.error(f"Failed to get shopping project: {e}")
+            logger.error("Failed to get shopping project: {}", e)
             raise
 
+    def _resolve_project_and_fetch(
+        self,
+        fetch: Callable[[str], Any]
+    ) -> Tuple[Optional[str], Any]:
+        """Resolve the shopping project and call fetch(project_id) for it.
+
+        When the project ID is already known (stale cache or configured ID) but still has to be
+        confirmed, both requests are issued concurrently; fetch is repeated only if the resolved
+        project turns out to be a different one.
+
+        Returns:
+            Tuple of (project_id, fetch result), or (None, None) if the project was not found
+        """
+        candidate_id = self._cached_project_id or self._project_id_cfg
+
+        if self._fresh_cached_project_id() or not candidate_id:
+            project_id = self._get_shopping_project_id()
+            return project_id, fetch(project_id) if project_id else None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(self._get_shopping_project_id)
+            result_future = executor.submit(fetch, candidate_id)
+            project_id = project_future.result()
+            try:
+                result = result_future.result()
+                fetched = True
+            except Exception as e:
+                logger.debug("Concurrent fetch for project {} failed: {}", candidate_id, e)
+                fetched = False
+
+        if not project_id:
+            return None, None
+        if not fetched or project_id != candidate_id:
+            result = fetch(project_id)
+        return project_id, result
+
     @create_todoist_retry_decorator()
-    def _get_current_tasks_state(self, project_id: str) -> Dict:
-        """Get current state of all tasks in the shopping list."""
+    def _sync_snapshot(self, resource_types: Tuple[str, ...]) -> Dict:
+        """Fetch a full snapshot of several resource types in a single Sync API request."""
+        return post_sync({
+            "sync_token": "*",
+            "resource_types": json.dumps(list(resource_types))
+        })
+
+    def _sync_items(self) -> Dict[str, Dict]:
+        """Bring the in-memory item mirror up to date using the Sync API.
+
+        The first call performs a full sync; later calls only receive items changed since the
+        previous sync_token. Completed and deleted items are dropped so the mirror matches the
+        active tasks returned by the REST API.
+
+        Returns:
+            Dictionary mapping item IDs to Sync API items
+        """
+        request = {"sync_token": self._sync_token, "resource_types": '["items"]'}
         try:
-            tasks = self.todoist_client.get_tasks(project_id=project_id)
+            data = post_sync(request)
+        except requests.exceptions.HTTPError as e:
+            # Anything other than a rejected token (rate limiting, auth, server errors) is left
+            # to the retry policy with the token intact
+            if self._sync_token == "*" or not is_invalid_sync_token_error(e):
+                raise
+            logger.warning("Sync token rejected, falling back to full sync")
+            self._sync_token = "*"
+            data = post_sync({**request, "sync_token": "*"})
+
+        if data.get('full_sync'):
+            self._items = {}
+        for item in data.get('items', []):
+            if item.get('is_deleted') or item.get('checked'):
+                self._items.pop(item['id'], None)
+            else:
+                self._items[item['id']] = item
+        self._sync_token = data['sync_token']
+        return self._items
+
+    @create_todoist_retry_decorator()
+    def _get_current_tasks_state(self, project_id: str) -> Optional[Dict]:
+        """Fetch current state of all tasks in the shopping list.
+
+        Returns:
+            Dictionary of task states, or None if they match the stored state
+        """
+        try:
+            # One pass over the mirror extracts the digest rows; the dict is only built on change
+            rows = sorted(
+                (item['id'], item['content'], item['section_id'], item['checked'])
+                for item in self._sync_items().values()
+                if item['project_id'] == project_id
+            )
+            if compute_tasks_digest(rows) == self.state.digest:
+                return None
+
             return {
-                task.id: {
-                    'content': task.content,
-                    'section_id': task.section_id,
-                    'is_completed': task.is_completed
+                task_id: {
+                    'content': content,
+                    'section_id': section_id,
+                    'is_completed': is_completed
                 }
-                for task in tasks
+                for task_id, content, section_id, is_completed in rows
             }
         except Exception as e:
-            logger.error(f"Failed to get tasks: {e}")
+            logger.error("Failed to get tasks: {}", e)
             raise
 
     def check_and_sync(self) -> None:
         """Check for changes in Todoist and sync them."""
-        with self._lock:
-            try:
-                logger.info("Starting Todoist sync check...")
+        # Back off after repeated organizer failures instead of retrying every tick
+        if time.monotonic() < self._circuit_open_until:
+            logger.info(
+                "Skipping sync after {} consecutive organize failures; retrying in {:.0f}s",
+                self._consecutive_organize_failures,
+                self._circuit_open_until - time.monotonic()
+            )
+            return
 
-                # Get the shopping list project
-                project_id = self._get_shopping_project_id()
-                if not project_id:
-                    logger.warning(
-                        f"Shopping list project '{settings.TODOIST_SHOPPING_PROJECT_NAME}' not found"
-                    )
-                    return
+        # Skip this tick instead of queueing behind a sync that is still running
+        if not self._lock.acquire(blocking=False):
+            logger.debug("Sync already running, skipping")
+            return
 
-                # Get current and previous states
-                current_state = self._get_current_tasks_state(project_id)
+        try:
+            logger.info("Starting Todoist sync check...")
 
-                # Check for changes
-                if self.state.has_changed(current_state):
-                    logger.info("Changes detected in shopping list, organizing items...")
-                    try:
-                        organize_shopping_list()
-                        # Only update state if organization was successful
-                        self.state.update(current_state)
-                        self.state.save()
-                        logger.info("Shopping list organization completed successfully")
-                    except Exception as e:
-                        logger.error(f"Failed to organize shopping list: {e}")
-                        logger.exception(e)
-                        # Don't save state so we can retry next time
-                        raise
-                else:
-                    logger.info("No changes detected in shopping list")
-
-                logger.info("Todoist sync check completed")
-            except Exception as e:
-                logger.error(f"Todoist sync check failed: {e}")
-                logger.exception(e)
-                raise
+            # Get the shopping list project and its current task state
+            project_id, current_state = self._resolve_project_and_fetch(
+                self._get_current_tasks_state
+            )
+            if not project_id:
+                logger.warning("Shopping list project '{}' not found", self._project_name)
+                return
+
+            # Check for changes (None means the task digest matched the stored state)
+            if current_state is not None and not self.state.diff(current_state).needs_organizing:
+                logger.info("No unsectioned items were added or changed, skipping organization")
+                self.state.update(current_state)
+                self._queue_state_save()
+            elif current_state is not None:
+                logger.info("Changes detected in shopping list, organizing items...")
+                try:
+                    openai_client = self._get_openai_client()
+                    if openai_client is not None:
+                        organize_shopping_list(self.todoist_client, openai_client, project_id)
+                    self._consecutive_organize_failures = 0
+                    # Only update state if organization was successful
+                    self.state.update(current_state)
+                    self._queue_state_save()
+                    logger.info("Shopping list organization completed successfully")
+                except Exception as e:
+                    logger.error("Failed to organize shopping list: {}", e)
+                    logger.exception(e)
+                    self._consecutive_organize_failures += 1
+                    backoff = min(
+                        2 ** self._consecutive_organize_failures,
+                        MAX_ORGANIZE_BACKOFF_SECONDS
+                    )
+                    self._circuit_open_until = time.monotonic() + backoff + random.random() * 30
+                    # Don't save state so we can retry next time
+                    raise
+            else:
+                logger.info("No changes detected in shopping list")
+
+            logger.info("Todoist sync check completed")
+        except Exception as e:
+            logger.error("Todoist sync check failed: {}", e)
+            logger.exception(e)
+            # Re-resolve the project next time in case it was moved or deleted
+            self._cached_project_id = None
+            raise
+        finally:
+            self._lock.release()
 
     def health_check(self) -> bool:
         """Verify Todoist API connectivity and project access.
@@ -150,36 +350,53 @@ class ShoppingListSync:
         try:
             logger.info("Running health check...")
 
-            # Check Todoist API connectivity
-            project_id = self._get_shopping_project_id()
+            # Check Todoist API connectivity; projects and sections arrive in one request
+            snapshot = self._sync_snapshot(("projects", "sections"))
+            project_names = {
+                p['id']: p['name'] for p in snapshot.get('projects', [])
+                if not p.get('is_deleted') and not p.get('is_archived')
+            }
+            project_id = self._fresh_cached_project_id()
+            if project_id not in project_names:
+                project_id = find_shopping_project_id(
+                    project_names,
+                    self._project_id_cfg,
+                    self._project_name
+                )
             if not project_id:
                 logger.error(
-                    f"Health check failed: Shopping list project "
-                    f"'{settings.TODOIST_SHOPPING_PROJECT_NAME}' not found"
+                    "Health check failed: Shopping list project '{}' not found",
+                    self._project_name
                 )
                 return False
+            self._cache_project_id(project_id)
 
-            project = self.todoist_client.get_project(project_id=project_id)
-            logger.info(f"✓ Connected to Todoist project: {project.name} (ID: {project.id})")
+            logger.info("✓ Connected to Todoist project: {} (ID: {})", project_names[project_id], project_id)
 
             # Check if we have sections
-            sections = self.todoist_client.get_sections(project_id=project_id)
-            logger.info(f"✓ Found {len(sections)} sections in project")
+            sections = [
+                s for s in snapshot.get('sections', [])
+                if s['project_id'] == project_id and not s.get('is_deleted')
+            ]
+            logger.info("✓ Found {} sections in project", len(sections))
 
             logger.info("Health check passed!")
             return True
 
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
+            logger.error("Health check failed: {}", e)
             logger.exception(e)
             return False
 
     def start(self) -> None:
         """Start the sync scheduler in daemon mode."""
-        logger.info(f"Starting Shopping List Sync daemon (interval: {self.sync_interval}s)...")
+        logger.info("Starting Shopping List Sync daemon (interval: {}s)...", self.sync_interval)
 
-        # Create scheduler
-        self._scheduler = BackgroundScheduler(timezone=settings.SCHEDULER_TIMEZONE)
+        # APScheduler is only needed in daemon mode, so --once/--check never import it
+        from apscheduler.schedulers.blocking import BlockingScheduler
+
+        # Create scheduler; it runs its loop on the main thread
+        self._scheduler = BlockingScheduler(timezone=settings.SCHEDULER_TIMEZONE)
         self._scheduler.add_job(
             self.check_and_sync,
             'interval',
@@ -191,26 +408,23 @@ class ShoppingListSync:
         # Set up signal handlers for graceful shutdown
         def shutdown_handler(signum, frame):
             logger.info("Received shutdown signal, stopping scheduler...")
-            if self._scheduler:
+            if self._scheduler and self._scheduler.running:
                 self._scheduler.shutdown()
             logger.info("Scheduler stopped. Exiting.")
-            sys.exit(0)
 
         signal.signal(signal.SIGINT, shutdown_handler)
         signal.signal(signal.SIGTERM, shutdown_handler)
 
-        # Start scheduler
-        self._scheduler.start()
+        # Start scheduler; blocks until shutdown
         logger.info("Scheduler started. Press Ctrl+C to stop.")
-
-        # Keep the main thread alive
         try:
-            while True:
-                time.sleep(1)
+            self._scheduler.start()
         except (KeyboardInterrupt, SystemExit):
             logger.info("Shutting down...")
-            if self._scheduler:
+            if self._scheduler and self._scheduler.running:
                 self._scheduler.shutdown()
+        finally:
+            self.flush_state()
 
     def stop(self) -> None:
         """Stop the sync scheduler."""
@@ -218,3 +432,4 @@ class ShoppingListSync:
             logger.info("Stopping scheduler...")
             self._scheduler.shutdown()
             self._scheduler = None
+        self.flush_state()
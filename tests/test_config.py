@@ -1,11 +1,53 @@
 """Tests for configuration module."""
 
+import os
+
 import pytest
-from shopping_list_sync.config import load_categories
+from shopping_list_sync.config import load_categories, settings
+
 
+@pytest.fixture
+def categories_file(tmp_path, monkeypatch):
+    """Point settings at a temporary categories file."""
+    path = tmp_path / "categories.yaml"
+    path.write_text('categories:\n  produce:\n    emoji: "🥬"\n    keywords: [apples]\n')
+    monkeypatch.setattr(settings, "CATEGORIES_FILE", str(path))
+    return path
 
-def test_load_categories():
+
+def test_load_categories(categories_file):
     """Test loading categories from YAML."""
-    # This would need a test categories file
-    # For now, just a placeholder
-    pass
+    categories = load_categories()
+    assert categories["produce"]["emoji"] == "🥬"
+    assert categories["produce"]["keywords"] == ["apples"]
+
+
+def test_load_categories_reuses_cached_result(categories_file):
+    """Test that an unchanged file is not re-parsed."""
+    assert load_categories() is load_categories()
+
+
+def test_load_categories_reloads_on_change(categories_file):
+    """Test that editing the file invalidates the cache."""
+    load_categories()
+    categories_file.write_text('categories:\n  dairy:\n    emoji: "🥛"\n')
+    stat = categories_file.stat()
+    os.utime(categories_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(load_categories()) == ["dairy"]
+
+
+def test_load_categories_missing_file(tmp_path, monkeypatch):
+    """Test that a missing file raises FileNotFoundError."""
+    monkeypatch.setattr(settings, "CATEGORIES_FILE", str(tmp_path / "missing.yaml"))
+    with pytest.raises(FileNotFoundError):
+        load_categories()
+
+
+def test_load_categories_precomputes_names(categories_file):
+    """Test that display and section names are derived on load."""
+    categories_file.write_text('categories:\n  meat_seafood:\n    emoji: "🥩"\n')
+
+    category = load_categories()["meat_seafood"]
+    assert category["_display_name"] == "Meat Seafood"
+    assert category["_section_name"] == "🥩 Meat Seafood"
@@ -0,0 +1,168 @@
+"""Tests for organizer module."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+from shopping_list_sync import organizer
+from shopping_list_sync.organizer import (
+    _map_categories_to_tasks,
+    _partition_tasks,
+    build_system_prompt,
+    find_shopping_project_id,
+    is_retryable_todoist_error,
+    move_tasks,
+    wait_for_todoist_retry,
+)
+
+
+def make_task(content, section_id=None, parent_id=None, task_id=None):
+    """Build a minimal stand-in for a Todoist Task."""
+    return SimpleNamespace(
+        id=task_id or content,
+        content=content,
+        section_id=section_id,
+        parent_id=parent_id,
+    )
+
+
+def test_partition_tasks():
+    """Test splitting tasks into unlabeled and existing items."""
+    milk = make_task("Milk")
+    tasks = [milk, make_task(" Bread ", section_id="s1"), make_task("Butter", parent_id="p1")]
+
+    unlabeled, existing = _partition_tasks(iter(tasks))
+
+    assert unlabeled == [milk]
+    assert existing == {"bread", "butter"}
+
+
+def test_map_categories_to_tasks():
+    """Test mapping OpenAI item names back to tasks."""
+    milk = make_task("Milk")
+    almond_milk = make_task("Almond milk")
+    apples = make_task("2 Apples")
+    bananas = make_task("Ripe bananas")
+    response = {"Dairy": ["milk", "Almond Milk"], "Produce": ["apples", "bananas", ""]}
+
+    categorized = _map_categories_to_tasks(response, [milk, almond_milk, apples, bananas])
+
+    assert categorized == {"dairy": [milk, almond_milk], "produce": [apples, bananas]}
+
+
+def test_find_shopping_project_id():
+    """Test that the configured ID wins and names match ignoring case and whitespace."""
+    projects = {"p0": "Groceries", "p2": " Shopping ", "p3": "SHOPPING"}
+
+    assert find_shopping_project_id(projects, "p3", "shopping") == "p3"
+    assert find_shopping_project_id(projects, "missing", "shopping") == "p2"
+    assert find_shopping_project_id(projects, None, "hardware") is None
+
+
+def test_move_tasks_reports_failed_commands(monkeypatch):
+    """Test that per-command Sync API errors are returned as failures."""
+    milk = make_task("Milk", task_id="1")
+    bread = make_task("Bread", task_id="2")
+    sent = []
+
+    def fake_post(url, headers, data, timeout):
+        commands = json.loads(data["commands"])
+        sent.append(commands)
+        statuses = {c["uuid"]: "ok" for c in commands}
+        statuses[commands[1]["uuid"]] = {"error": "Invalid section"}
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"sync_status": statuses})
+
+    monkeypatch.setattr(organizer.todoist_session, "post", fake_post)
+
+    failed = move_tasks([(milk, "s1"), (bread, "s2")])
+
+    assert len(sent) == 1
+    assert [c["args"] for c in sent[0]] == [
+        {"id": "1", "section_id": "s1"},
+        {"id": "2", "section_id": "s2"},
+    ]
+    assert failed == [(bread, "s2", {"error": "Invalid section"})]
+
+
+def test_move_tasks_retries_failed_request_instead_of_reporting_failures(monkeypatch):
+    """Test that a failed Sync API request is retried and never reported as failed moves."""
+    milk = make_task("Milk", task_id="1")
+    attempts = []
+
+    def flaky_post(url, headers, data, timeout):
+        commands = json.loads(data["commands"])
+        attempts.append([c["uuid"] for c in commands])
+        if len(attempts) == 1:
+            raise requests.exceptions.ConnectionError("down")
+        statuses = {c["uuid"]: "ok" for c in commands}
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: {"sync_status": statuses})
+
+    monkeypatch.setattr(organizer.todoist_session, "post", flaky_post)
+    monkeypatch.setattr(organizer._post_sync_commands.retry, "sleep", lambda seconds: None)
+
+    assert move_tasks([(milk, "s1")]) == []
+    # The retry resends the same command UUIDs so Todoist applies them only once
+    assert attempts[0] == attempts[1]
+
+
+def test_move_tasks_raises_when_request_keeps_failing(monkeypatch):
+    """Test that a persistently failing Sync API request raises."""
+    def failing_post(url, headers, data, timeout):
+        raise requests.exceptions.ConnectionError("down")
+
+    monkeypatch.setattr(organizer.todoist_session, "post", failing_post)
+    monkeypatch.setattr(organizer._post_sync_commands.retry, "sleep", lambda seconds: None)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        move_tasks([(make_task("Milk"), "s1")])
+
+
+def test_build_system_prompt_is_cached_per_config():
+    """Test that the system prompt is rebuilt only for a new configuration."""
+    config = {"produce": {"emoji": "🥬", "keywords": ["apples"], "_display_name": "Produce"}}
+
+    prompt = build_system_prompt(config)
+
+    assert "- Produce (🥬): apples" in prompt
+    assert build_system_prompt(config) is prompt
+    assert build_system_prompt(dict(config)) is not prompt
+
+
+@pytest.mark.parametrize(
+    "status_code, expected",
+    [(429, True), (500, True), (503, True), (400, False), (404, False)],
+)
+def test_is_retryable_todoist_error_http_status(status_code, expected):
+    """Test which HTTP errors are retried."""
+    error = requests.exceptions.HTTPError(response=SimpleNamespace(status_code=status_code))
+    assert is_retryable_todoist_error(error) is expected
+
+
+def test_is_retryable_todoist_error_network():
+    """Test that connection errors and timeouts are retried."""
+    assert is_retryable_todoist_error(requests.exceptions.ConnectionError())
+    assert is_retryable_todoist_error(requests.exceptions.Timeout())
+    assert not is_retryable_todoist_error(ValueError())
+
+
+def make_retry_state(error):
+    """Build a minimal tenacity retry state for a failed attempt."""
+    return SimpleNamespace(
+        outcome=SimpleNamespace(exception=lambda: error),
+        attempt_number=1,
+    )
+
+
+def test_wait_for_todoist_retry_honors_retry_after():
+    """Test that a 429 Retry-After header sets the delay."""
+    response = SimpleNamespace(status_code=429, headers={"Retry-After": "7"})
+    error = requests.exceptions.HTTPError(response=response)
+
+    assert 7 <= wait_for_todoist_retry(make_retry_state(error)) <= 8
+
+
+def test_wait_for_todoist_retry_falls_back_to_backoff():
+    """Test that other errors use bounded exponential backoff."""
+    delay = wait_for_todoist_retry(make_retry_state(requests.exceptions.ConnectionError()))
+    assert 0 <= delay <= 10
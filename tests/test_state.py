@@ -0,0 +1,76 @@
+"""Tests for state management module."""
+
+from shopping_list_sync.state import SyncState
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Test that saved state can be loaded back."""
+    state_file = tmp_path / "sync_state.json"
+    tasks = {"1": {"content": "Milk", "section_id": None, "is_completed": False}}
+
+    state = SyncState(str(state_file))
+    state.update(tasks)
+    state.save()
+
+    loaded = SyncState(str(state_file))
+    loaded.load()
+    assert loaded.tasks_state == tasks
+    assert loaded.last_sync == state.last_sync
+    assert not state_file.with_suffix('.tmp').exists()
+
+
+def test_has_changed(tmp_path):
+    """Test change detection against the stored state."""
+    state = SyncState(str(tmp_path / "sync_state.json"))
+    assert not state.has_changed({})
+
+    state.update({"1": {"content": "Milk", "section_id": None, "is_completed": False}})
+    assert not state.has_changed({"1": {"is_completed": False, "section_id": None, "content": "Milk"}})
+    assert state.has_changed({"1": {"content": "Milk", "section_id": "s1", "is_completed": False}})
+
+
+def test_diff_classifies_changes(tmp_path):
+    """Test that diff groups task IDs by kind of change."""
+    state = SyncState(str(tmp_path / "sync_state.json"))
+    state.update({
+        "1": {"content": "Milk", "section_id": None, "is_completed": False},
+        "2": {"content": "Bread", "section_id": "s1", "is_completed": False},
+        "3": {"content": "Eggs", "section_id": "s1", "is_completed": False},
+    })
+
+    diff = state.diff({
+        "1": {"content": "Oat milk", "section_id": "s2", "is_completed": False},
+        "2": {"content": "Bread", "section_id": "s1", "is_completed": True},
+        "4": {"content": "Apples", "section_id": None, "is_completed": False},
+    })
+
+    assert diff.added == {"4"}
+    assert diff.removed == {"3"}
+    assert diff.moved == {"1"}
+    assert diff.edited == {"1"}
+    assert diff.completed == {"2"}
+    assert diff.needs_organizing
+
+
+def test_diff_removals_and_completions_need_no_organizing(tmp_path):
+    """Test that removing or completing items does not require organizing."""
+    state = SyncState(str(tmp_path / "sync_state.json"))
+    state.update({
+        "1": {"content": "Milk", "section_id": "s1", "is_completed": False},
+        "2": {"content": "Bread", "section_id": "s1", "is_completed": False},
+    })
+
+    diff = state.diff({"1": {"content": "Milk", "section_id": "s1", "is_completed": True}})
+
+    assert not diff.needs_organizing
+
+
+def test_diff_moves_into_sections_need_no_organizing(tmp_path):
+    """Test that items moved into a section, as the organizer does, need no organizing."""
+    state = SyncState(str(tmp_path / "sync_state.json"))
+    state.update({"1": {"content": "Milk", "section_id": None, "is_completed": False}})
+
+    diff = state.diff({"1": {"content": "Milk", "section_id": "s1", "is_completed": False}})
+
+    assert diff.moved == {"1"}
+    assert not diff.needs_organizing
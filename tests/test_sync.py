@@ -0,0 +1,288 @@
+"""Tests for sync module."""
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import requests
+from shopping_list_sync import sync as sync_module
+from shopping_list_sync.config import settings
+from shopping_list_sync.sync import ShoppingListSync
+
+
+class FakeTodoist:
+    """Records calls made by the sync manager."""
+
+    def __init__(self, projects):
+        self.projects = projects
+        self.calls = []
+
+    def get_projects(self):
+        self.calls.append("get_projects")
+        return self.projects
+
+    def get_project(self, project_id):
+        self.calls.append("get_project")
+        for project in self.projects:
+            if project.id == project_id:
+                return project
+        raise requests.exceptions.HTTPError(response=SimpleNamespace(status_code=404))
+
+
+@pytest.fixture
+def sync(tmp_path, monkeypatch):
+    """Sync manager with a temporary state file and fake Todoist client."""
+    monkeypatch.setattr(settings, "STATE_FILE", tmp_path / "sync_state.json")
+    monkeypatch.setattr(settings, "TODOIST_SHOPPING_PROJECT_ID", None)
+    monkeypatch.setattr(settings, "TODOIST_SHOPPING_PROJECT_NAME", "shopping")
+    manager = ShoppingListSync(sync_interval=60)
+    manager.todoist_client = FakeTodoist([SimpleNamespace(id="p1", name="shopping")])
+    return manager
+
+
+def test_project_id_is_cached(sync):
+    """Test that the project lookup is reused between calls."""
+    assert sync._get_shopping_project_id() == "p1"
+    assert sync._get_shopping_project_id() == "p1"
+    assert sync.todoist_client.calls == ["get_projects"]
+
+
+def test_project_name_match_ignores_case_and_whitespace(sync):
+    """Test that the project name lookup is case- and whitespace-insensitive."""
+    sync.todoist_client.projects = [
+        SimpleNamespace(id="p0", name="Groceries"),
+        SimpleNamespace(id="p2", name=" Shopping "),
+        SimpleNamespace(id="p3", name="SHOPPING"),
+    ]
+
+    assert sync._get_shopping_project_id() == "p2"
+
+
+def test_configured_project_id_is_fetched_directly(sync):
+    """Test that a configured project ID is confirmed without listing all projects."""
+    sync._project_id_cfg = "p1"
+
+    assert sync._get_shopping_project_id() == "p1"
+    assert sync.todoist_client.calls == ["get_project"]
+
+
+def test_missing_configured_project_id_falls_back_to_name(sync):
+    """Test that a configured project ID that no longer exists falls back to the name."""
+    sync._project_id_cfg = "gone"
+
+    assert sync._get_shopping_project_id() == "p1"
+    assert sync.todoist_client.calls == ["get_project", "get_projects"]
+
+
+def test_health_check_uses_single_snapshot_request(sync, monkeypatch):
+    """Test that the health check fetches projects and sections in one request."""
+    requests_sent = []
+
+    def fake_post_sync(data):
+        requests_sent.append(data)
+        return {
+            "projects": [
+                {"id": "p0", "name": "shopping", "is_archived": True},
+                {"id": "p1", "name": "shopping"},
+            ],
+            "sections": [
+                {"id": "s1", "project_id": "p1", "name": "🥬 Produce"},
+                {"id": "s2", "project_id": "p2", "name": "Other"},
+            ],
+        }
+
+    monkeypatch.setattr(sync_module, "post_sync", fake_post_sync)
+
+    assert sync.health_check()
+    assert requests_sent == [{"sync_token": "*", "resource_types": '["projects", "sections"]'}]
+    # The resolved project is cached for the sync loop
+    assert sync._get_shopping_project_id() == "p1"
+    assert sync.todoist_client.calls == []
+
+
+def test_health_check_fails_without_project(sync, monkeypatch):
+    """Test that a missing shopping project fails the health check."""
+    monkeypatch.setattr(sync_module, "post_sync", lambda data: {"projects": [], "sections": []})
+
+    assert not sync.health_check()
+
+
+def make_item(item_id, content, section_id=None, project_id="p1", **fields):
+    """Build a Sync API item payload."""
+    return {
+        "id": item_id,
+        "project_id": project_id,
+        "content": content,
+        "section_id": section_id,
+        "checked": False,
+        "is_deleted": False,
+        **fields,
+    }
+
+
+def test_current_tasks_state_skipped_when_digest_matches(sync, monkeypatch):
+    """Test that unchanged tasks are reported as None."""
+    responses = iter([
+        {"sync_token": "t1", "full_sync": True, "items": [
+            make_item("2", "Bread", "s1"),
+            make_item("1", "Milk"),
+            make_item("3", "Hammer", project_id="p2"),
+        ]},
+        {"sync_token": "t2", "full_sync": False, "items": []},
+    ])
+    monkeypatch.setattr(sync_module, "post_sync", lambda data: next(responses))
+
+    current_state = sync._get_current_tasks_state("p1")
+    assert current_state == {
+        "1": {"content": "Milk", "section_id": None, "is_completed": False},
+        "2": {"content": "Bread", "section_id": "s1", "is_completed": False},
+    }
+
+    sync.state.update(current_state)
+    assert sync._get_current_tasks_state("p1") is None
+
+
+def test_sync_items_applies_incremental_changes(sync, monkeypatch):
+    """Test that Sync API deltas update the item mirror."""
+    requests_sent = []
+    responses = iter([
+        {"sync_token": "t1", "full_sync": True, "items": [
+            make_item("1", "Milk"),
+            make_item("2", "Bread"),
+        ]},
+        {"sync_token": "t2", "full_sync": False, "items": [
+            make_item("1", "Oat milk"),
+            make_item("2", "Bread", checked=True),
+            make_item("3", "Eggs"),
+        ]},
+    ])
+
+    def fake_post_sync(data):
+        requests_sent.append(data["sync_token"])
+        return next(responses)
+
+    monkeypatch.setattr(sync_module, "post_sync", fake_post_sync)
+
+    sync._sync_items()
+    items = sync._sync_items()
+
+    assert requests_sent == ["*", "t1"]
+    assert {item_id: item["content"] for item_id, item in items.items()} == {
+        "1": "Oat milk",
+        "3": "Eggs",
+    }
+
+
+def make_http_error(status_code, body=None):
+    """Build an HTTPError carrying a minimal response."""
+    response = SimpleNamespace(status_code=status_code, headers={}, json=lambda: body or {})
+    return requests.exceptions.HTTPError(response=response)
+
+
+def test_sync_items_falls_back_to_full_sync_on_invalid_token(sync, monkeypatch):
+    """Test that a rejected sync_token triggers a full sync."""
+    sync._sync_token = "tok"
+    requests_sent = []
+
+    def fake_post_sync(data):
+        requests_sent.append(data["sync_token"])
+        if data["sync_token"] == "tok":
+            raise make_http_error(400, {"error_tag": "INVALID_SYNC_TOKEN"})
+        return {"sync_token": "t1", "full_sync": True, "items": [make_item("1", "Milk")]}
+
+    monkeypatch.setattr(sync_module, "post_sync", fake_post_sync)
+
+    assert list(sync._sync_items()) == ["1"]
+    assert requests_sent == ["tok", "*"]
+
+
+@pytest.mark.parametrize("status_code", [401, 403, 429])
+def test_sync_items_keeps_token_on_other_client_errors(sync, monkeypatch, status_code):
+    """Test that rate limiting and auth errors propagate without discarding the token."""
+    sync._sync_token = "tok"
+    requests_sent = []
+
+    def fake_post_sync(data):
+        requests_sent.append(data["sync_token"])
+        raise make_http_error(status_code)
+
+    monkeypatch.setattr(sync_module, "post_sync", fake_post_sync)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        sync._sync_items()
+    assert requests_sent == ["tok"]
+    assert sync._sync_token == "tok"
+
+
+def test_check_and_sync_skips_when_already_running(sync, monkeypatch):
+    """Test that an overlapping sync returns immediately."""
+    monkeypatch.setattr(sync, "_resolve_project_and_fetch", lambda fetch: pytest.fail("synced"))
+
+    sync._lock.acquire()
+    try:
+        sync.check_and_sync()
+    finally:
+        sync._lock.release()
+
+
+def test_queued_state_save_is_written_on_flush(sync):
+    """Test that state saves happen in the background and flush waits for them."""
+    sync.state.update({"1": {"content": "Milk", "section_id": None, "is_completed": False}})
+    sync._queue_state_save()
+    sync.flush_state()
+
+    assert settings.STATE_FILE.exists()
+
+
+def test_flush_state_raises_when_save_fails(sync, monkeypatch):
+    """Test that a failed background save is reported by flush_state."""
+    monkeypatch.setattr(sync.state, "state_file", Path("/proc/nonexistent/sync_state.json"))
+    sync._queue_state_save()
+
+    with pytest.raises(OSError):
+        sync.flush_state()
+    # The error is reported once
+    sync.flush_state()
+
+
+def test_organizer_moves_do_not_trigger_another_organize(sync, monkeypatch):
+    """Test that the organizer's own moves into sections are not organized again."""
+    states = iter([
+        {"1": {"content": "Milk", "section_id": None, "is_completed": False}},
+        {"1": {"content": "Milk", "section_id": "s1", "is_completed": False}},
+    ])
+    organized = []
+
+    monkeypatch.setattr(sync, "_resolve_project_and_fetch", lambda fetch: ("p1", next(states)))
+    monkeypatch.setattr(sync, "_get_openai_client", lambda: object())
+    monkeypatch.setattr(sync_module, "organize_shopping_list", lambda *args: organized.append(args))
+
+    sync.check_and_sync()
+    sync.check_and_sync()
+
+    assert len(organized) == 1
+    assert sync.state.tasks_state["1"]["section_id"] == "s1"
+
+
+def test_organize_failure_opens_circuit(sync, monkeypatch):
+    """Test that a failed organize run suspends the following ticks."""
+    current_state = {"1": {"content": "Milk", "section_id": None, "is_completed": False}}
+    fetches = []
+
+    def fake_fetch(fetch):
+        fetches.append(1)
+        return "p1", current_state
+
+    def failing_organize(*args):
+        raise RuntimeError("bad section")
+
+    monkeypatch.setattr(sync, "_resolve_project_and_fetch", fake_fetch)
+    monkeypatch.setattr(sync, "_get_openai_client", lambda: object())
+    monkeypatch.setattr(sync_module, "organize_shopping_list", failing_organize)
+
+    with pytest.raises(RuntimeError):
+        sync.check_and_sync()
+    sync.check_and_sync()
+
+    assert fetches == [1]
+    assert sync._consecutive_organize_failures == 1